@@ -0,0 +1,65 @@
+# Copyright (c) 2024 Thomas VIAL
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Optional Numba-compiled kernel for cross-product index enumeration.
+
+Numba and NumPy are soft dependencies: when either is missing, `fill_mixed_radix` is
+`None` and callers fall back to `itertools.product`.
+"""
+
+try:
+    import numba
+    import numpy
+except ImportError:
+    numba = None
+    numpy = None
+
+
+if numba is not None:
+    # cache=True persists the compiled kernel on disk (next to the module's
+    # __pycache__): only the very first run of a given environment pays the multi-second
+    # compilation, subsequent processes load the binary straight from the cache
+    @numba.njit(cache=True, boundscheck=False)
+    def fill_mixed_radix(sizes, start, out):
+        """Fill `out` with consecutive mixed-radix index rows, starting at combination `start`.
+
+        Row r holds the digits of `start + r` in the mixed-radix system whose digit sizes
+        are `sizes`, with the last digit varying fastest -- the same order as
+        `itertools.product`.
+
+        Parameters
+        ----------
+        sizes
+            Radix of each slot, i.e. the number of candidate values per binding, as an
+            int64 array (signed, like the rank below, so the arithmetic stays integral
+            instead of being promoted to float64)
+        start
+            Rank of the first combination to generate
+        out
+            Preallocated `(n_rows, n_slots)` int64 array receiving the index rows
+        """
+        n_rows, n_slots = out.shape
+        for row in range(n_rows):
+            x = start + row
+            for slot in range(n_slots - 1, -1, -1):
+                out[row, slot] = x % sizes[slot]
+                x //= sizes[slot]
+else:
+    fill_mixed_radix = None
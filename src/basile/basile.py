@@ -18,10 +18,24 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import sys
+import weakref
+
+from collections.abc import Mapping
+from copy import copy
 from dataclasses import dataclass, fields, is_dataclass
-from itertools import product
-from copy import deepcopy
-from typing import List, Any, Iterable, Dict
+from functools import lru_cache
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from itertools import chain, islice, product
+from math import prod
+from operator import attrgetter, itemgetter
+from typing import List, Any, Callable, Iterable, Dict, NamedTuple, Optional, Tuple
+
+# Underscore-aliased so the soft-dependency plumbing stays out of the namespace
+# re-exported by the package's star import
+from ._product_kernel import fill_mixed_radix as _fill_mixed_radix, numpy as _numpy
 
 
 class CandidateAccessType:
@@ -40,21 +54,20 @@ class CandidateAccessType:
     DICT_VALUE = 4
 
 
-@dataclass
-class CandidateAccess:
-    """How & where to access a candidate directly placed in a container"""
-
-    #: How
-    access_type: CandidateAccessType
+#: How & where to access a candidate directly placed in a container, as a plain
+#: `(access_type, position)` pair: the access type is one of the `CandidateAccessType`
+#: constants, and the meaning of the position depends on the container type.
+#: A plain tuple is allocated in C, without the `__init__` and `__dict__` overhead a
+#: dataclass would pay on every path step of the walk.
+CandidateAccess = Tuple[int, Any]
 
-    #: Where (the type depends on the container type)
-    position: Any
 
-
-@dataclass(init=False)
+@dataclass(init=False, slots=True)
 class Either:
     """Placeholder for candidate values in templates"""
-    values: List[Any]
+
+    #: Immutable, hashable and freely shareable across plans
+    values: Tuple[Any, ...]
 
     def __init__(self, *values):
         """Create a list of candidates
@@ -66,6 +79,50 @@ class Either:
         """
         self.values = values
 
+    def __iter__(self):
+        return iter(self.values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """The field names of a dataclass, in declaration order.
+    `dataclasses.fields` rebuilds its tuple on every call, so the names are computed once
+    and memoized per class.
+
+    Parameters
+    ----------
+    cls : type
+        The dataclass to introspect
+
+    Returns
+    -------
+    Tuple[str, ...]
+        The names of the fields of `cls`
+    """
+    return tuple(field.name for field in fields(cls))
+
+
+@lru_cache(maxsize=None)
+def _spec_key(path: Tuple[CandidateAccess, ...]) -> str:
+    """The dotted representation of an access path, for specification purposes.
+    Paths are fixed per template, so the keys are computed once and memoized; they are
+    also interned, letting later dictionary lookups take the identity-compare fast path.
+
+    Parameters
+    ----------
+    path : Tuple[CandidateAccess, ...]
+        The access path to represent
+
+    Returns
+    -------
+    str
+        The positions of the path joined with dots
+    """
+    return sys.intern('.'.join(str(access[1]) for access in path))
+
 
 def _getter(container: Any, access: CandidateAccess) -> Any:
     """Generic getter working across all candidate access types
@@ -80,12 +137,12 @@ def _getter(container: Any, access: CandidateAccess) -> Any:
     Returns
     -------
     Any
-        The value of the item in the container (roughly `container[access.position]`)
+        The value of the item in the container (roughly `container[position]`)
     """
-    if access.access_type == CandidateAccessType.DATACLASS_ATTR:
-        return getattr(container, access.position)
+    if access[0] == CandidateAccessType.DATACLASS_ATTR:
+        return getattr(container, access[1])
     else:
-        return container[access.position]
+        return container[access[1]]
 
 
 def _setter(container: Any, access: CandidateAccess, value: Any, parent: Any, parent_access: CandidateAccess) -> None:
@@ -106,22 +163,20 @@ def _setter(container: Any, access: CandidateAccess, value: Any, parent: Any, pa
     parent_access : CandidateAccess
         When `container` is a tuple, `parent_access` is the access to it from its parent
     """
-    if access.access_type == CandidateAccessType.DATACLASS_ATTR:
-        setattr(container, access.position, value)
-    elif access.access_type == CandidateAccessType.TUPLE_ITEM:
+    access_type, position = access
+    if access_type == CandidateAccessType.DATACLASS_ATTR:
+        setattr(container, position, value)
+    elif access_type == CandidateAccessType.TUPLE_ITEM:
         # Work around tuple immutability by building a new one
-        new_tuple = tuple([
-            value if i == access.position else previous_value
-            for i, previous_value in enumerate(container)
-        ])
+        new_tuple = container[:position] + (value,) + container[position + 1:]
         # Candidates are not supposed to be nested so we can assume there is no upstream ancestor to handle.
         # Hence `parent` == `parent_item` == `None` in this call
         _setter(parent, parent_access, new_tuple, None, None)
     else:
-        container[access.position] = value
+        container[position] = value
 
 
-@dataclass
+@dataclass(slots=True)
 class BindingRealization:
     """Realization of a binding, i.e. an access path associated with a single value from candidates
     """
@@ -159,10 +214,10 @@ class BindingRealization:
         Dict[str, Any]
             A dictionary whose keys are dotted represenation of the access path, and values the bound values
         """
-        return {'.'.join(map(lambda item: str(item.position), self.path)): self.value}
+        return {_spec_key(tuple(self.path)): self.value}
 
 
-@dataclass
+@dataclass(slots=True)
 class Binding:
     """A binding associates an access path with a list of candidate values given by an `Either` object
     """
@@ -184,159 +239,597 @@ class Binding:
         return (BindingRealization(self.path, value) for value in self.values)
 
 
-@dataclass
-class TemplateRealization:
+class BindingView(Mapping):
+    """Read-only, dict-like specification of a realization.
+    The key tuple is shared across all realizations of a template; only the value tuple
+    is allocated per realization, making the view much lighter than an equivalent dict.
+    Comparison with plain dictionaries works both ways.
+    """
+
+    __slots__ = ('_keys', '_values')
+
+    def __init__(self, keys: Tuple[str, ...], values: Tuple[Any, ...]):
+        """Create a view over parallel key and value tuples
+
+        Parameters
+        ----------
+        keys : Tuple[str, ...]
+            Dotted access paths, shared across realizations
+        values : Tuple[Any, ...]
+            The bound values, parallel to `keys`
+        """
+        self._keys = keys
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[self._keys.index(key)]
+        except ValueError:
+            raise KeyError(key) from None
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, BindingView) and self._keys is other._keys:
+            # Views of the same template share their key tuple, so comparing two of them
+            # is a single C-level tuple comparison
+            return self._values == other._values
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class TemplateRealization(NamedTuple):
     """Realization of a full template
     """
 
     #: The aggregation of the specification of the binding realizations associated with the template
-    specification: Dict[str, Any]
+    specification: Mapping
 
     #: The templates with all candidates replaced with values
     realization: Any
 
 
-def _get_bindings(path: List[CandidateAccess], container: Any) -> Iterable[Binding]:
-    """Recursively walks `container` and iterate over the candidates therein to yield bindings
+#: A linked access path: `None` at the root, then nested `(parent_link, access)` pairs.
+#: Extending a linked path is O(1); it is frozen into a tuple of `CandidateAccess` only
+#: when a candidate is actually found at its end.
+_PathLink = Optional[Tuple[Any, CandidateAccess]]
+
+
+def _expand_dataclass(path: _PathLink, container: Any) -> Iterable[Tuple[_PathLink, Any]]:
+    """Stack entries for the fields of dataclass `container`, in reverse field order
+
+    Parameters
+    ----------
+    path : _PathLink
+        The linked path to `container` in its parent hierarchy
+    container
+        The dataclass to expand
+
+    Returns
+    -------
+    Iterable[Tuple[_PathLink, Any]]
+        `(path, child)` entries ready to be pushed on the walk stack
+    """
+    return (
+        ((path, (CandidateAccessType.DATACLASS_ATTR, name)), getattr(container, name))
+        for name in reversed(_field_names(type(container)))
+    )
+
+
+def _expand_list(path: _PathLink, container: list) -> Iterable[Tuple[_PathLink, Any]]:
+    """Stack entries for the items of list `container`, in reverse item order
+
+    Parameters
+    ----------
+    path : _PathLink
+        The linked path to `container` in its parent hierarchy
+    container : list
+        The list to expand
+
+    Returns
+    -------
+    Iterable[Tuple[_PathLink, Any]]
+        `(path, child)` entries ready to be pushed on the walk stack
+    """
+    return (
+        ((path, (CandidateAccessType.LIST_ITEM, i)), container[i])
+        for i in reversed(range(len(container)))
+    )
+
+
+def _expand_tuple(path: _PathLink, container: tuple) -> Iterable[Tuple[_PathLink, Any]]:
+    """Stack entries for the items of tuple `container`, in reverse item order
+
+    Parameters
+    ----------
+    path : _PathLink
+        The linked path to `container` in its parent hierarchy
+    container : tuple
+        The tuple to expand
+
+    Returns
+    -------
+    Iterable[Tuple[_PathLink, Any]]
+        `(path, child)` entries ready to be pushed on the walk stack
+    """
+    return (
+        ((path, (CandidateAccessType.TUPLE_ITEM, i)), container[i])
+        for i in reversed(range(len(container)))
+    )
+
+
+def _expand_dict(path: _PathLink, container: dict) -> Iterable[Tuple[_PathLink, Any]]:
+    """Stack entries for the values of dictionary `container`, in reverse key order
+
+    Parameters
+    ----------
+    path : _PathLink
+        The linked path to `container` in its parent hierarchy
+    container : dict
+        The dictionary to expand
+
+    Returns
+    -------
+    Iterable[Tuple[_PathLink, Any]]
+        `(path, child)` entries ready to be pushed on the walk stack
+    """
+    return (
+        ((path, (CandidateAccessType.DICT_VALUE, key)), value)
+        for key, value in reversed(container.items())
+    )
+
+
+#: Container expanders keyed by exact container type; dataclasses are handled separately
+#: since they share no common type
+_CONTAINER_EXPANDERS = {
+    list: _expand_list,
+    tuple: _expand_tuple,
+    dict: _expand_dict,
+}
+
+
+def _find_expander(container: Any) -> Optional[Callable[[_PathLink, Any], Iterable[Tuple[_PathLink, Any]]]]:
+    """The expander able to walk `container`, or `None` for atomic leaves.
+    The exact-type lookup is the fast path; dataclasses and subclasses of the built-in
+    containers fall back to isinstance checks, in the same order as the historical
+    cascade. Binding discovery and clone planning both dispatch through here, so the
+    two traversals can never disagree on what is a container.
 
     Parameters
     ----------
-    path : List[CandidateAccess]
-        The path to `container` in its parent hierarchy
     container
-        The container to get bindings from
+        The element to classify
 
     Returns
     -------
-    Iterable[Binding]
-        Bindings made from candidate values found under `container`
+    Optional[Callable[[_PathLink, Any], Iterable[Tuple[_PathLink, Any]]]]
+        The matching expander, or `None` if `container` is an atomic leaf
     """
-    if isinstance(container, Either):
-        # If we encounter a Candidate, stop recursion, otherwise go deeper
-        yield Binding(path, container.values)
-    elif is_dataclass(container):
-        yield from _get_bindings_from_class(path, container)
+    expander = _CONTAINER_EXPANDERS.get(type(container))
+    if expander is not None:
+        return expander
+    elif is_dataclass(container) and not isinstance(container, type):
+        return _expand_dataclass
     elif isinstance(container, list):
-        yield from _get_bindings_from_list(path, container)
+        return _expand_list
     elif isinstance(container, tuple):
-        yield from _get_bindings_from_tuple(path, container)
+        return _expand_tuple
     elif isinstance(container, dict):
-        yield from _get_bindings_from_dict(path, container)
+        return _expand_dict
+    else:
+        return None
 
 
-def _get_bindings_from_class(path: List[CandidateAccess], container: dataclass) -> Iterable[Binding]:
-    """Recursively walks dataclass `container`
+def _freeze_path(link: _PathLink) -> Tuple[CandidateAccess, ...]:
+    """Unwind a linked path into a root-to-leaf tuple of accesses
 
     Parameters
     ----------
-    path : List[CandidateAccess]
-        The path to `container` in its parent hierarchy
-    container : dataclass
-        The dataclass to get bindings from
+    link : _PathLink
+        The linked path to freeze
 
     Returns
     -------
-    Iterable[Binding]
-        Bindings made from candidate values found under `container`
+    Tuple[CandidateAccess, ...]
+        The accesses of the path, from the root down to the element it points to
     """
-    for field in fields(container):
-        yield from _get_bindings(
-            path + [CandidateAccess(access_type=CandidateAccessType.DATACLASS_ATTR, position=field.name)],
-            getattr(container, field.name)
-        )
+    accesses = []
+    while link is not None:
+        link, access = link
+        accesses.append(access)
+    accesses.reverse()
+    return tuple(accesses)
 
 
-def _get_bindings_from_list(path: List[CandidateAccess], container: list) -> Iterable[Binding]:
-    """Recursively walks list `container`
+def _iter_bindings(template: Any) -> Iterable[Tuple[Tuple[CandidateAccess, ...], List[Any]]]:
+    """Walk `template` depth-first with an explicit stack and yield every candidate found,
+    as a `(path, values)` pair. Candidates are yielded in the same order as a left-to-right
+    recursive descent would produce.
 
     Parameters
     ----------
-    path : List[CandidateAccess]
-        The path to `container` in its parent hierarchy
-    container : list
-        The list to get bindings from
+    template
+        The containing template with candidates buried at any depth
 
     Returns
     -------
-    Iterable[Binding]
-        Bindings made from candidate values found under `container`
+    Iterable[Tuple[Tuple[CandidateAccess, ...], List[Any]]]
+        Pairs of access path and candidate values, one per candidate under `template`
     """
-    for i, value in enumerate(container):
-        yield from _get_bindings(
-            path + [CandidateAccess(access_type=CandidateAccessType.LIST_ITEM, position=i)],
-            value
-        )
+    stack = [(None, template)]
+    while stack:
+        path, container = stack.pop()
+        if isinstance(container, Either):
+            # If we encounter a Candidate, stop the descent, otherwise go deeper
+            yield _freeze_path(path), container.values
+        else:
+            expander = _find_expander(container)
+            if expander is not None:
+                stack.extend(expander(path, container))
+
+
+#: Tags identifying the node kinds of a clone plan
+_PLAN_DATACLASS = 'dc'
+_PLAN_LIST = 'list'
+_PLAN_TUPLE = 'tuple'
+_PLAN_DICT = 'dict'
+_PLAN_ATOM = 'atom'
+_PLAN_STATIC = 'static'
+
+
+def _build_clone_plan(template: Any) -> Tuple[str, Any]:
+    """Walk `template` once and record how to rebuild it, container by container.
+
+    The resulting plan is a nested tree of `(kind, payload)` tuples, one node per
+    container in the template. Atomic leaves (anything that is not a dataclass,
+    list, tuple or dictionary) and whole candidate-free sub-trees are recorded by
+    reference so that replaying the plan never copies them.
 
+    Parameters
+    ----------
+    template
+        Template containing `Either` instances
 
-def _get_bindings_from_tuple(path: List[CandidateAccess], container: tuple) -> Iterable[Binding]:
-    """Recursively walks tuple `container`
+    Returns
+    -------
+    Tuple[str, Any]
+        The root node of the clone plan
+    """
+    plan, _ = _build_clone_plan_node(template)
+    return plan
+
+
+def _build_clone_plan_node(template: Any) -> Tuple[Tuple[str, Any], bool]:
+    """Build the clone plan node for `template` and report whether any candidate is
+    reachable under it. Candidate-free sub-trees are recorded as static: no binding
+    path ever leads into them, so all realizations can share them by reference and
+    replaying the plan never copies them.
 
     Parameters
     ----------
-    path : List[CandidateAccess]
-        The path to `container` in its parent hierarchy
-    container : tuple
-        The tuple to get bindings from
+    template
+        Template containing `Either` instances
 
     Returns
     -------
-    Iterable[Binding]
-        Bindings made from candidate values found under `container`
+    Tuple[Tuple[str, Any], bool]
+        The plan node, and whether a candidate was found under `template`
     """
-    for i, value in enumerate(container):
-        yield from _get_bindings(
-            path + [CandidateAccess(access_type=CandidateAccessType.TUPLE_ITEM, position=i)],
-            value
-        )
+    if isinstance(template, Either):
+        # The placeholder marks the very spot a setter will overwrite, so its
+        # enclosing containers must be cloned
+        return (_PLAN_ATOM, template), True
+
+    # Same dispatch as the binding walk, so both traversals see the same containers
+    expander = _find_expander(template)
+    if expander is _expand_dataclass:
+        field_plans = []
+        has_candidate = False
+        for name in _field_names(type(template)):
+            field_plan, field_has_candidate = _build_clone_plan_node(getattr(template, name))
+            field_plans.append((name, field_plan))
+            has_candidate = has_candidate or field_has_candidate
+        if has_candidate:
+            return (_PLAN_DATACLASS, (type(template), template, field_plans)), True
+    elif expander is _expand_list:
+        item_plans = []
+        has_candidate = False
+        for value in template:
+            item_plan, item_has_candidate = _build_clone_plan_node(value)
+            item_plans.append(item_plan)
+            has_candidate = has_candidate or item_has_candidate
+        if has_candidate:
+            return (_PLAN_LIST, (template, item_plans)), True
+    elif expander is _expand_tuple:
+        item_plans = []
+        has_candidate = False
+        deep_candidate = False
+        for value in template:
+            item_plan, item_has_candidate = _build_clone_plan_node(value)
+            item_plans.append(item_plan)
+            has_candidate = has_candidate or item_has_candidate
+            deep_candidate = deep_candidate or (item_has_candidate and not isinstance(value, Either))
+        if has_candidate:
+            if not deep_candidate:
+                # Every candidate is a direct item of the tuple: the compiled setters
+                # rebuild the tuple and write it into its parent anyway, so all
+                # realizations can share the original instead of cloning it
+                return (_PLAN_STATIC, template), True
+            return (_PLAN_TUPLE, (template, tuple(item_plans))), True
+    elif expander is _expand_dict:
+        value_plans = []
+        has_candidate = False
+        for key, value in template.items():
+            value_plan, value_has_candidate = _build_clone_plan_node(value)
+            value_plans.append((key, value_plan))
+            has_candidate = has_candidate or value_has_candidate
+        if has_candidate:
+            return (_PLAN_DICT, (template, value_plans)), True
+    else:
+        # Atomic leaf: no copy is ever needed, keep the reference
+        return (_PLAN_ATOM, template), False
 
+    # Container with no candidate anywhere below: share it across all realizations
+    return (_PLAN_STATIC, template), False
 
-def _get_bindings_from_dict(path: List[CandidateAccess], container: dict) -> Iterable[Binding]:
-    """Recursively walks dictionary `container`
+
+def _make_cloner(plan: Tuple[str, Any]) -> Callable[[], Any]:
+    """Compile a clone plan into a closure producing a fresh copy of the template it was
+    built from. All tag dispatch happens here, once per node; the returned closures do
+    nothing but build containers.
+
+    Containers with candidates below them are created anew so realizations never
+    interfere, while atomic leaves and candidate-free sub-trees are returned by
+    identity. Cloned containers start as a single C-level shallow copy of the original
+    and only the slots with clones below them are overwritten.
 
     Parameters
     ----------
-    path : List[CandidateAccess]
-        The path to `container` in its parent hierarchy
-    container : dict
-        The dictionary to get bindings from
+    plan : Tuple[str, Any]
+        A clone plan built by `_build_clone_plan`
 
     Returns
     -------
-    Iterable[Binding]
-        Bindings made from candidate values found under `container`
+    Callable[[], Any]
+        A closure returning a fresh clone of the planned template on each call
     """
-    for key, value in container.items():
-        yield from _get_bindings(
-            path + [CandidateAccess(access_type=CandidateAccessType.DICT_VALUE, position=key)],
-            value
+    kind, payload = plan
+    if kind == _PLAN_ATOM or kind == _PLAN_STATIC:
+        return lambda: payload
+    elif kind == _PLAN_DATACLASS:
+        cls, original, field_plans = payload
+        # Copy-on-write rebuild: take the original's __dict__ in a single C-level copy,
+        # then overwrite only the fields under which a clone is actually needed
+        makers = tuple(
+            (name, _make_cloner(field_plan))
+            for name, field_plan in field_plans
+            if field_plan[0] not in (_PLAN_ATOM, _PLAN_STATIC)
+        )
+
+        if hasattr(original, '__dict__'):
+            def make() -> Any:
+                clone = cls.__new__(cls)
+                clone.__dict__.update(original.__dict__)
+                for name, maker in makers:
+                    clone.__dict__[name] = maker()
+                return clone
+        else:
+            # Slots-based dataclasses have no __dict__ to copy: shallow-copy the
+            # instance instead, then overwrite the fields needing fresh clones
+            def make() -> Any:
+                clone = copy(original)
+                for name, maker in makers:
+                    setattr(clone, name, maker())
+                return clone
+
+        return make
+    elif kind == _PLAN_LIST:
+        original, item_plans = payload
+        makers = tuple(
+            (position, _make_cloner(item_plan))
+            for position, item_plan in enumerate(item_plans)
+            if item_plan[0] not in (_PLAN_ATOM, _PLAN_STATIC)
+        )
+        # list.copy would degrade subclasses to plain lists; copy.copy preserves them
+        copy_original = original.copy if type(original) is list else (lambda: copy(original))
+        if not makers:
+            return copy_original
+
+        def make_list() -> Any:
+            clone = copy_original()
+            for position, maker in makers:
+                clone[position] = maker()
+            return clone
+
+        return make_list
+    elif kind == _PLAN_TUPLE:
+        original, item_plans = payload
+        makers = tuple(_make_cloner(item_plan) for item_plan in item_plans)
+        cls = type(original)
+        if cls is tuple:
+            return lambda: tuple(maker() for maker in makers)
+        # Rebuild subclasses through their own type; namedtuples take their items
+        # through _make rather than the constructor
+        rebuild = getattr(cls, '_make', cls)
+        return lambda: rebuild(maker() for maker in makers)
+    else:
+        original, value_plans = payload
+        makers = tuple(
+            (key, _make_cloner(value_plan))
+            for key, value_plan in value_plans
+            if value_plan[0] not in (_PLAN_ATOM, _PLAN_STATIC)
         )
+        # dict.copy would degrade subclasses to plain dicts; copy.copy preserves them
+        copy_original = original.copy if type(original) is dict else (lambda: copy(original))
+        if not makers:
+            return copy_original
+
+        def make_dict() -> Any:
+            clone = copy_original()
+            for key, maker in makers:
+                clone[key] = maker()
+            return clone
+
+        return make_dict
 
 
-def _realize(template: Any, binding_realizations: Iterable[BindingRealization]) -> TemplateRealization:
-    """Apply a collection of binding realizations to a template
+def _make_walker(path: Tuple[CandidateAccess, ...]) -> Callable[[Any], Any]:
+    """Compile an access path prefix into a closure walking from a container down to the
+    element the path points to
 
     Parameters
     ----------
-    template
-        Template containing`Either` instances
-    binding_realizations : Iterable[BindingRealization]
-        Binding realizations to apply to the template
+    path : Tuple[CandidateAccess, ...]
+        The access path to compile (possibly empty)
+
+    Returns
+    -------
+    Callable[[Any], Any]
+        A closure taking a container and returning the element at the end of the path
+    """
+    getters = tuple(
+        attrgetter(access[1]) if access[0] == CandidateAccessType.DATACLASS_ATTR else itemgetter(access[1])
+        for access in path
+    )
+
+    def walk(container: Any) -> Any:
+        for getter in getters:
+            container = getter(container)
+        return container
+
+    return walk
+
+
+def _make_setter(path: Tuple[CandidateAccess, ...]) -> Callable[[Any, Any], None]:
+    """Compile an access path into a closure setting a value at the end of the path.
+    The compiled closure hardcodes the getters and the terminal assignment for its specific
+    path, so no access type is ever inspected again when it runs.
+
+    Parameters
+    ----------
+    path : Tuple[CandidateAccess, ...]
+        The access path to compile
 
     Returns
     -------
-    TemplateRealization
-        The result of applying the binding realizations to the template
+    Callable[[Any, Any], None]
+        A closure taking a container and a value, and setting the value at the end of the path
+    """
+    terminal_type, terminal_position = path[-1]
+    if terminal_type == CandidateAccessType.TUPLE_ITEM:
+        # Work around tuple immutability by rebuilding the tuple and setting it in its own
+        # container. Candidates are not supposed to be nested so we can assume the latter
+        # is not a tuple itself.
+        walk = _make_walker(path[:-2])
+        tuple_type, tuple_position = path[-2]
+        position = terminal_position
+
+        if tuple_type == CandidateAccessType.DATACLASS_ATTR:
+            def setter(container: Any, value: Any) -> None:
+                parent = walk(container)
+                previous = getattr(parent, tuple_position)
+                setattr(parent, tuple_position, previous[:position] + (value,) + previous[position + 1:])
+        else:
+            def setter(container: Any, value: Any) -> None:
+                parent = walk(container)
+                previous = parent[tuple_position]
+                parent[tuple_position] = previous[:position] + (value,) + previous[position + 1:]
+    else:
+        walk = _make_walker(path[:-1])
+        position = terminal_position
+
+        if terminal_type == CandidateAccessType.DATACLASS_ATTR:
+            def setter(container: Any, value: Any) -> None:
+                setattr(walk(container), position, value)
+        else:
+            def setter(container: Any, value: Any) -> None:
+                walk(container)[position] = value
+
+    return setter
+
+
+@dataclass(slots=True)
+class _TemplatePlan:
+    """Everything there is to know about a template in order to count and iterate its
+    realizations, computed by a single up-front walk
     """
-    real = deepcopy(template)
-    specification = {}
-    for binding_realization in binding_realizations:
-        specification.update(binding_realization.get_specification())
-        binding_realization.apply(real)
-    return TemplateRealization(specification=specification, realization=real)
 
+    #: Access paths of the bindings, in discovery order
+    paths: Tuple[Tuple[CandidateAccess, ...], ...]
+
+    #: Candidate value tuples, parallel to `paths`
+    value_lists: Tuple[Tuple[Any, ...], ...]
+
+    #: Compiled setters, parallel to `paths`, as built by `_make_setter`
+    setters: Tuple[Callable[[Any, Any], None], ...]
+
+    #: Dotted specification keys, parallel to `paths`, shared by all realizations
+    spec_keys: Tuple[str, ...]
 
-def _get_all_binding_realizations(template: Any) -> Iterable[BindingRealization]:
-    """Build an iterable for all combinations of candidate values found inside the given template
+    #: Compiled cloner for the template, as built by `_make_cloner`
+    cloner: Callable[[], Any]
+
+    #: Compiled single-combination realizer, as built by `_make_realizer`
+    realizer: Callable[[Tuple[Any, ...]], 'TemplateRealization']
+
+
+def _make_realizer(
+    cloner: Callable[[], Any],
+    setters: Tuple[Callable[[Any, Any], None], ...],
+    spec_keys: Tuple[str, ...]
+) -> Callable[[Tuple[Any, ...]], TemplateRealization]:
+    """Fuse a plan's cloner, setters and specification keys into a single closure turning
+    one combination of candidate values into a `TemplateRealization`. Everything the
+    closure needs is bound at plan-build time, so realizing a combination is pure
+    execution with no lookups into the plan.
+
+    Parameters
+    ----------
+    cloner : Callable[[], Any]
+        The plan's compiled cloner
+    setters : Tuple[Callable[[Any, Any], None], ...]
+        The plan's compiled setters
+    spec_keys : Tuple[str, ...]
+        The plan's shared specification keys
+
+    Returns
+    -------
+    Callable[[Tuple[Any, ...]], TemplateRealization]
+        A closure mapping a values tuple to its realization
+    """
+    def realize(values: Tuple[Any, ...]) -> TemplateRealization:
+        clone = cloner()
+        for setter, value in zip(setters, values):
+            setter(clone, value)
+        return TemplateRealization(specification=BindingView(spec_keys, values), realization=clone)
+
+    return realize
+
+
+#: Cache of template plans keyed by template identity. Each entry pairs a weak reference
+#: to the template (so a recycled id can never alias a different object) with its plan.
+#: Plans keep their template alive through the compiled cloner, so the cache is bounded:
+#: the oldest entry is dropped once full, releasing its template with it. Under threads
+#: the cache is best-effort -- concurrent callers may redundantly rebuild a plan -- but
+#: it must never crash where the stateless realizer could not.
+_PLAN_CACHE = {}
+
+#: Maximum number of cached template plans
+_PLAN_CACHE_SIZE = 8
+
+
+def _build_template_plan(template: Any) -> _TemplatePlan:
+    """Walk the given template once and gather everything needed to realize it.
+    Plans are memoized per template object; a cached plan is revalidated against a
+    fresh binding walk, so a template whose candidates were changed in place gets a
+    rebuilt plan instead of stale realizations, while an untouched template only pays
+    the walk and amortizes the setter/cloner compilation.
 
     Parameters
     ----------
@@ -345,14 +838,44 @@ def _get_all_binding_realizations(template: Any) -> Iterable[BindingRealization]
 
     Returns
     -------
-    Iterable[Any]
-        An iterable yielding all possible concrete combinations of candidates
+    _TemplatePlan
+        The plan for counting and iterating realizations of the template
     """
-    bindings = _get_bindings([], template)
-    return product(*(
-        binding.realize()
-        for binding in bindings
-    ))
+    key = id(template)
+    bindings = list(_iter_bindings(template))
+    paths = tuple(path for path, _ in bindings)
+    value_lists = tuple(tuple(values) for _, values in bindings)
+
+    cached = _PLAN_CACHE.get(key)
+    if cached is not None and cached[0]() is template:
+        plan = cached[1]
+        # Cheap for an untouched template: the value tuples are then the very same
+        # objects, so the comparisons short-circuit on identity
+        if plan.paths == paths and plan.value_lists == value_lists:
+            return plan
+
+    setters = tuple(_make_setter(path) for path in paths)
+    spec_keys = tuple(_spec_key(path) for path in paths)
+    cloner = _make_cloner(_build_clone_plan(template))
+    plan = _TemplatePlan(
+        paths=paths,
+        value_lists=value_lists,
+        setters=setters,
+        spec_keys=spec_keys,
+        cloner=cloner,
+        realizer=_make_realizer(cloner, setters, spec_keys)
+    )
+    try:
+        reference = weakref.ref(template)
+    except TypeError:
+        # Plain lists, tuples and dicts cannot be weakly referenced; their plans are
+        # simply rebuilt on every call
+        return plan
+    if key not in _PLAN_CACHE and len(_PLAN_CACHE) >= _PLAN_CACHE_SIZE:
+        # A concurrent evictor may have removed the same oldest key already
+        _PLAN_CACHE.pop(next(iter(_PLAN_CACHE)), None)
+    _PLAN_CACHE[key] = (reference, plan)
+    return plan
 
 
 def count_realizations(template: Any) -> int:
@@ -369,12 +892,174 @@ def count_realizations(template: Any) -> int:
     int
         The number of combinations
     """
-    count = 1
-    for binding in _get_bindings([], template):
-        count *= len(binding.values)
-    return count
+    # Counting only needs the candidate arities: walk the template directly instead of
+    # building a full plan with compiled setters and cloners
+    return prod(len(values) for _, values in _iter_bindings(template))
+
+
+#: Number of combinations above which index enumeration is offloaded to Numba, when available
+_NUMBA_ENUMERATION_THRESHOLD = 1 << 20
+
+#: Number of index rows generated per Numba kernel call, keeping memory bounded however
+#: large the cross product is
+_NUMBA_ENUMERATION_BATCH = 4096
+
+
+def _iter_value_combinations(value_lists: Tuple[Tuple[Any, ...], ...]) -> Iterable[Tuple[Any, ...]]:
+    """Iterate over all combinations of candidate values, in `itertools.product` order.
+
+    Small cross products go through `itertools.product` directly. Very large ones are
+    enumerated, when Numba is installed, by a compiled mixed-radix kernel producing
+    index rows in bounded-size batches.
+
+    Parameters
+    ----------
+    value_lists : Tuple[Tuple[Any, ...], ...]
+        Candidate value tuples, one per binding
+
+    Returns
+    -------
+    Iterable[Tuple[Any, ...]]
+        All combinations of candidate values, one value per binding
+    """
+    if _fill_mixed_radix is not None and value_lists:
+        total = prod(map(len, value_lists))
+        if total >= _NUMBA_ENUMERATION_THRESHOLD:
+            # int64 throughout: Numba types the start rank as a signed int, and mixing
+            # it with unsigned arrays would promote the kernel arithmetic to float64
+            sizes = _numpy.array([len(values) for values in value_lists], dtype=_numpy.int64)
+            value_tuples = tuple(value_lists)
+            out = _numpy.empty((_NUMBA_ENUMERATION_BATCH, len(value_lists)), dtype=_numpy.int64)
+            for batch_start in range(0, total, _NUMBA_ENUMERATION_BATCH):
+                batch = out[:min(_NUMBA_ENUMERATION_BATCH, total - batch_start)]
+                _fill_mixed_radix(sizes, batch_start, batch)
+                for row in batch:
+                    yield tuple(values[i] for values, i in zip(value_tuples, row))
+            return
+    yield from product(*value_lists)
+
+
+#: Specification shared by all realizations of candidate-free templates
+_EMPTY_SPECIFICATION = BindingView((), ())
+
+#: Number of realizations materialized together by realize_template. Batching lets the
+#: setters be applied column-wise (one setter across all clones of the batch) while
+#: keeping memory bounded however large the cross product is.
+_REALIZATION_BATCH = 256
+
+
+def realize_template_batched(template, batch_size: int = _REALIZATION_BATCH):
+    """Iterate over all realizations of the template, in lists of up to `batch_size`.
+    Amortizes the per-yield generator overhead for consumers that process realizations
+    eagerly anyway; `realize_template` remains the one-at-a-time view over it.
+
+    Parameters
+    ----------
+    template
+        The containing template with candidates buried at any depth
+    batch_size : int
+        Maximum number of realizations per yielded list
+
+    Returns
+    -------
+    Iterable[List[TemplateRealization]]
+        Iteration over all possible realizations of the template, in batches
+    """
+    plan = _build_template_plan(template)
+    if not plan.value_lists:
+        # Static template: a single realization with nothing to apply, so skip the
+        # product machinery altogether
+        yield [TemplateRealization(specification=_EMPTY_SPECIFICATION, realization=plan.cloner())]
+        return
+    cloner, setters, spec_keys = plan.cloner, plan.setters, plan.spec_keys
+    combinations = _iter_value_combinations(plan.value_lists)
+    while True:
+        batch = list(islice(combinations, batch_size))
+        if not batch:
+            return
+        clones = [cloner() for _ in batch]
+        # Loop interchange: apply one setter across the whole batch before moving on to
+        # the next one, so each closure stays hot while it runs
+        for position, setter in enumerate(setters):
+            for clone, values in zip(clones, batch):
+                setter(clone, values[position])
+        yield [
+            TemplateRealization(specification=BindingView(spec_keys, values), realization=clone)
+            for values, clone in zip(batch, clones)
+        ]
 
 
 def realize_template(template):
-    for binding_realizations in _get_all_binding_realizations(template):
-        yield _realize(template, binding_realizations)
+    return chain.from_iterable(realize_template_batched(template))
+
+
+def _realize_slice(template: Any, start: int, stop: int) -> List[TemplateRealization]:
+    """Materialize the realizations of `template` whose ranks fall in `[start, stop)`.
+    This is the worker behind `realize_template_parallel`: each process rebuilds the
+    template plan and decodes its own rank range, so only the template and the results
+    ever cross process boundaries.
+
+    Parameters
+    ----------
+    template
+        The containing template with candidates buried at any depth
+    start : int
+        Rank of the first realization to materialize
+    stop : int
+        Rank after the last realization to materialize
+
+    Returns
+    -------
+    List[TemplateRealization]
+        The realizations of the slice, in rank order
+    """
+    plan = _build_template_plan(template)
+    realizations = []
+    for rank in range(start, stop):
+        # Decode the rank into one candidate value per binding, the last binding varying
+        # fastest -- the same order as itertools.product
+        values = []
+        remaining = rank
+        for value_list in reversed(plan.value_lists):
+            remaining, index = divmod(remaining, len(value_list))
+            values.append(value_list[index])
+        values.reverse()
+        realizations.append(plan.realizer(tuple(values)))
+    return realizations
+
+
+def realize_template_parallel(template, max_workers: Optional[int] = None, chunk_size: int = 1024):
+    """Parallel version of `realize_template`, for cross products whose per-realization
+    processing is dominated by cloning and applying candidates. Rank ranges are spread
+    over worker processes; realizations are yielded in the same deterministic order as
+    `realize_template`. The template (and thus every candidate value) must be picklable.
+
+    Parameters
+    ----------
+    template
+        The containing template with candidates buried at any depth
+    max_workers : Optional[int]
+        Maximum number of worker processes (defaults to the machine's CPU count)
+    chunk_size : int
+        Number of realizations handled by a single worker invocation
+
+    Returns
+    -------
+    Iterable[TemplateRealization]
+        Iteration over all possible realizations of the template
+    """
+    total = count_realizations(template)
+    workers = max_workers if max_workers is not None else (cpu_count() or 1)
+    starts = iter(range(0, total, chunk_size))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Keep a bounded window of chunks in flight instead of submitting the whole
+        # grid up front, preserving the library's iterator-only memory profile
+        pending = deque(
+            executor.submit(_realize_slice, template, start, min(start + chunk_size, total))
+            for start in islice(starts, workers * 2)
+        )
+        while pending:
+            chunk = pending.popleft().result()
+            for start in islice(starts, 1):
+                pending.append(executor.submit(_realize_slice, template, start, min(start + chunk_size, total)))
+            yield from chunk
@@ -18,11 +18,14 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from unittest import TestCase
+from unittest import TestCase, skipIf
+from collections import namedtuple
 from dataclasses import dataclass
+from itertools import product
 from typing import List
 
 from basile import *
+from basile._product_kernel import fill_mixed_radix, numpy
 
 
 @dataclass
@@ -362,6 +365,97 @@ class TestBinder(TestCase):
         realizations = sorted(realize_template(template), key=sort_by_field2)
         self.assertListEqual(expected, realizations)
 
+    def test_binding_from_container_subclasses(self):
+        class CustomDict(dict):
+            pass
+
+        template = Level1(
+            field1=1,
+            field2=CustomDict(a=1, b=Either(11, 12)),
+            field3=Level2(field1='abc')
+        )
+
+        expected = [
+            TemplateRealization(
+                {'field2.b': 11},
+                Level1(
+                    field1=1,
+                    field2=CustomDict(a=1, b=11),
+                    field3=Level2(field1='abc')
+                )
+            ),
+            TemplateRealization(
+                {'field2.b': 12},
+                Level1(
+                    field1=1,
+                    field2=CustomDict(a=1, b=12),
+                    field3=Level2(field1='abc')
+                )
+            ),
+        ]
+        realizations = list(realize_template(template))
+        self.assertListEqual(expected, realizations)
+        for realization in realizations:
+            self.assertIsInstance(realization.realization.field2, CustomDict)
+
+    def test_binding_from_namedtuple(self):
+        Point = namedtuple('Point', ['a', 'b'])
+
+        template = Level1(
+            field1=1,
+            field2=Point(a=[Either(11, 12)], b=9),
+            field3=Level2(field1='abc')
+        )
+
+        expected = [
+            TemplateRealization(
+                {'field2.0.0': 11},
+                Level1(
+                    field1=1,
+                    field2=Point(a=[11], b=9),
+                    field3=Level2(field1='abc')
+                )
+            ),
+            TemplateRealization(
+                {'field2.0.0': 12},
+                Level1(
+                    field1=1,
+                    field2=Point(a=[12], b=9),
+                    field3=Level2(field1='abc')
+                )
+            ),
+        ]
+        realizations = list(realize_template(template))
+        self.assertListEqual(expected, realizations)
+        for realization in realizations:
+            self.assertIsInstance(realization.realization.field2, Point)
+
+    def test_realize_template_batched(self):
+        template = Level1(
+            field1=Either(1, 2, 3, 4, 5),
+            field2=Either([2, 3, 4], [4, 5, 6]),
+            field3=Level2(field1=Either('abc', 'def', 'ghi'))
+        )
+
+        expected = list(realize_template(template))
+        batches = list(realize_template_batched(template, batch_size=4))
+
+        # 30 realizations in batches of at most 4, so the iteration spans several batches
+        self.assertTrue(all(len(batch) <= 4 for batch in batches))
+        self.assertGreater(len(batches), 1)
+        self.assertListEqual(expected, [realization for batch in batches for realization in batch])
+
+    def test_realize_template_parallel(self):
+        template = Level1(
+            field1=1,
+            field2=Either([2, 3, 4], [4, 5, 6]),
+            field3=Level2(field1=Either('abc', 'def', 'ghi'))
+        )
+
+        expected = list(realize_template(template))
+        realizations = list(realize_template_parallel(template, chunk_size=2))
+        self.assertListEqual(expected, realizations)
+
     def test_count_realizations(self):
         template = Level1(
             field1=Either(1, 2, 3),
@@ -369,4 +463,16 @@ class TestBinder(TestCase):
             field3=Level2(field1=Either('abc', 'def', 'ghi', 'jkl'))
         )
 
-        self.assertEqual(3*1*2*3*4, count_realizations(template))
\ No newline at end of file
+        self.assertEqual(3*1*2*3*4, count_realizations(template))
+
+@skipIf(fill_mixed_radix is None, 'Numba and NumPy are not installed')
+class TestProductKernel(TestCase):
+    def test_fill_mixed_radix(self):
+        sizes = numpy.array([2, 3, 4], dtype=numpy.int64)
+        expected = list(product(range(2), range(3), range(4)))
+
+        for start, stop in ((0, 24), (5, 11), (23, 24)):
+            out = numpy.empty((stop - start, 3), dtype=numpy.int64)
+            fill_mixed_radix(sizes, start, out)
+            rows = [tuple(int(index) for index in row) for row in out]
+            self.assertListEqual(expected[start:stop], rows)